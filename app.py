@@ -1,5 +1,8 @@
 # app.py
 
+import os
+from io import BytesIO
+import charset_normalizer
 import streamlit as st
 import nltk
 from job_matcher import (
@@ -10,8 +13,21 @@ from job_matcher import (
     match_resume_with_jobs,
 )
 
-# Download the NLTK tokenizer data
-nltk.download('punkt')
+# Function to download the NLTK tokenizer data once per server process
+@st.cache_resource(show_spinner=False)
+def download_nltk_data():
+    """
+    Downloads the NLTK tokenizer data, once rather than on every script rerun.
+
+    Returns:
+        bool: Whether the data is available.
+    """
+    return nltk.download('punkt', quiet=True)
+
+download_nltk_data()
+
+# Number of leading bytes used to detect the encoding of uploaded files
+ENCODING_SAMPLE_SIZE = 4096
 
 # Streamlit UI setup
 st.title("Job Matching System")
@@ -22,40 +38,85 @@ job_files = st.file_uploader("Upload Job Descriptions (TEXT or JSON)", type=['tx
 # Upload Resume
 resume_file = st.file_uploader("Upload Candidate Resume (PDF or DOCX)", type=['pdf', 'docx'])
 
-# Function to read file content with error handling for encoding
-def read_file_content(file):
+# Function to decode file content, detecting its encoding
+def decode_file_content(raw):
     """
-    Reads the content of a given file and handles potential encoding issues.
+    Decodes the content of a file with its detected encoding.
+
+    Valid UTF-8 is decoded as such; otherwise the encoding is detected from the
+    first few kilobytes of the file and undecodable bytes are replaced rather than
+    raising.
 
     Args:
-        file: The uploaded file object.
+        raw (bytes): The raw content of the file.
 
     Returns:
-        str: The content of the file as a string, or None if decoding fails.
+        str: The content of the file as a string.
     """
     try:
-        return file.read().decode('utf-8')
+        return raw.decode('utf-8')
     except UnicodeDecodeError:
-        try:
-            return file.read().decode('ISO-8859-1')
-        except UnicodeDecodeError:
-            st.error("Could not decode the file. Please check the file format and encoding.")
-            return None
+        pass
+
+    encoding = charset_normalizer.detect(raw[:ENCODING_SAMPLE_SIZE])['encoding']
+    # Non-ASCII text past the sample is far more likely to be UTF-8 than anything else
+    if encoding in (None, 'ascii'):
+        encoding = 'utf-8'
+    return raw.decode(encoding, errors='replace')
+
+# Function to extract the text of an uploaded resume, cached by its raw content
+@st.cache_data(show_spinner=False)
+def extract_resume_text(content, file_type):
+    """
+    Extracts text from the raw bytes of an uploaded resume.
+
+    Results are cached on the file content, so reruns and re-uploads of the same
+    resume skip text extraction altogether.
+
+    Args:
+        content (bytes): The raw content of the uploaded file.
+        file_type (str): The MIME type of the uploaded file.
+
+    Returns:
+        str: Extracted text from the resume, or None if the file type is unsupported.
+    """
+    if file_type == 'application/pdf':
+        return extract_text_from_pdf(BytesIO(content))  # Extract text from PDF
+    elif file_type == 'application/vnd.openxmlformats-officedocument.wordprocessingml.document':
+        return extract_text_from_docx(BytesIO(content))  # Extract text from DOCX
+    return None
+
+# Function to parse uploaded job description files, cached by their raw content
+@st.cache_data(show_spinner=False)
+def load_job_descriptions(job_files_content):
+    """
+    Decodes and parses uploaded job description files.
+
+    Results are cached on the file contents, so reruns with unchanged job files
+    skip decoding and parsing altogether.
+
+    Args:
+        job_files_content (tuple): A `(raw content, file extension)` pair per file.
+
+    Returns:
+        JobCorpus: The parsed job descriptions.
+    """
+    return parse_job_descriptions([(decode_file_content(raw), extension) for raw, extension in job_files_content])
 
 # Check if both resume and job descriptions are uploaded
 if resume_file and job_files:
     # Process the uploaded resume file based on its type
-    if resume_file.type == 'application/pdf':
-        resume_text = extract_text_from_pdf(resume_file)  # Extract text from PDF
-    elif resume_file.type == 'application/vnd.openxmlformats-officedocument.wordprocessingml.document':
-        resume_text = extract_text_from_docx(resume_file)  # Extract text from DOCX
+    resume_text = extract_resume_text(resume_file.getvalue(), resume_file.type)
+    if resume_text is None:
+        st.error(f"Unsupported resume file type '{resume_file.type}'. Please upload a PDF or DOCX file.")
+        st.stop()
 
     # Extract skills, education, and experience from the resume text
     resume_info = extract_resume_info(resume_text)
 
     # Read and process job descriptions from the uploaded files
-    job_desc_texts = [read_file_content(file) for file in job_files]
-    job_descriptions = parse_job_descriptions(job_desc_texts)
+    job_descriptions = load_job_descriptions(
+        tuple((file.getvalue(), os.path.splitext(file.name)[1]) for file in job_files))
 
     # Match the resume information with the job descriptions
     match_results = match_resume_with_jobs(resume_info, job_descriptions)
@@ -1,26 +1,144 @@
 # job_matcher.py
 
+import hashlib
 import json
+import os
 import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache, reduce
+from io import BytesIO
+from itertools import chain
+from operator import or_
 import pdfplumber
+import pypdfium2 as pdfium
 from docx import Document
+import numpy as np
 import spacy
+from spacy.matcher import PhraseMatcher
+from spacy.util import filter_spans
+
+try:
+    import pymupdf
+except ImportError:  # PyMuPDF is optional; pypdfium2 and pdfplumber are always available
+    pymupdf = None
+
+# Regular expressions used to extract experience and education
+_EXPERIENCE_RE = re.compile(r'(\d+)\s+(years?|months?)\s+(of|in)?\s*([A-Za-z\s]+)')
+_EXP_SHORT_RE = re.compile(r'(\d+)\s+(years?|months?)')
+_EDU_RE = re.compile(r'\b(Bachelor|Master|PhD|Associate|Degree|Certification)\b', re.IGNORECASE)
+
+# Longest digit run read as a required experience figure; longer numbers (IDs,
+# references) are not experience and would overflow the int64 experience array
+MAX_EXPERIENCE_DIGITS = 4
+
+# Function to extract text from PDF files with PyMuPDF
+def _extract_pdf_text_pymupdf(source):
+    """
+    Extracts text from a PDF file using PyMuPDF (MuPDF's text extraction).
+
+    Args:
+        source: The path to the PDF file or its bytes.
+
+    Returns:
+        str: Extracted text from the PDF.
+    """
+    if isinstance(source, bytes):
+        doc = pymupdf.open(stream=source, filetype='pdf')
+    else:
+        doc = pymupdf.open(source)
+    with doc:
+        return ''.join(page.get_text('text') for page in doc)
+
+# Function to extract text from PDF files with pypdfium2
+def _extract_pdf_text_pdfium(source):
+    """
+    Extracts text from a PDF file using pypdfium2 (PDFium's text layer).
+
+    Args:
+        source: The path to the PDF file or its bytes.
+
+    Returns:
+        str: Extracted text from the PDF.
+    """
+    pdf = pdfium.PdfDocument(source)
+    try:
+        pages = []
+        for page in pdf:
+            textpage = page.get_textpage()
+            pages.append(textpage.get_text_bounded().replace('\r\n', '\n') + '\n')
+            textpage.close()
+            page.close()
+    finally:
+        pdf.close()
+    return ''.join(pages)
+
+# Function to extract text from PDF files with pdfplumber
+def _extract_pdf_text_pdfplumber(source):
+    """
+    Extracts text from a PDF file using pdfplumber.
+
+    Args:
+        source: The path to the PDF file or its bytes.
+
+    Returns:
+        str: Extracted text from the PDF.
+    """
+    with pdfplumber.open(BytesIO(source) if isinstance(source, bytes) else source) as pdf:
+        # Pages without a text layer (e.g. scanned images) yield None
+        return ''.join((page.extract_text() or '') + '\n' for page in pdf.pages)
+
+# Available PDF text extraction backends, fastest first
+PDF_BACKENDS = {
+    'pdfium': _extract_pdf_text_pdfium,
+    'pdfplumber': _extract_pdf_text_pdfplumber,
+}
+if pymupdf is not None:
+    PDF_BACKENDS = {'pymupdf': _extract_pdf_text_pymupdf, **PDF_BACKENDS}
+
+# Minimum number of non-whitespace characters for extracted PDF text to be
+# accepted without trying the next backend (less usually means a scanned PDF)
+MIN_PDF_TEXT_LENGTH = 100
 
 # Function to extract text from PDF files
-def extract_text_from_pdf(file):
+def extract_text_from_pdf(file, backend=None):
     """
     Extracts text from a PDF file.
 
+    By default the backends in `PDF_BACKENDS` are tried fastest first, and the next
+    one is only tried when a backend fails or returns less than `MIN_PDF_TEXT_LENGTH`
+    characters of text; the longest text found is returned.
+
     Args:
-        file (str): The path to the PDF file.
+        file: The path to the PDF file, its bytes, or a binary file object.
+        backend (str, optional): Use only this backend, one of `PDF_BACKENDS`.
 
     Returns:
         str: Extracted text from the PDF.
     """
-    with pdfplumber.open(file) as pdf:
-        text = ''
-        for page in pdf.pages:
-            text += page.extract_text() + '\n'
+    if backend is not None and backend not in PDF_BACKENDS:
+        raise ValueError(f"Unknown PDF backend '{backend}', expected one of {sorted(PDF_BACKENDS)}")
+
+    # Read file objects once, so every backend gets the same bytes
+    source = file.read() if hasattr(file, 'read') else file
+    if backend is not None:
+        return PDF_BACKENDS[backend](source)
+
+    text, error = None, None
+    for extract in PDF_BACKENDS.values():
+        try:
+            candidate = extract(source)
+        except Exception as e:  # Let the next backend try files this one cannot read
+            error = e
+            continue
+        if text is None or len(candidate.strip()) > len(text.strip()):
+            text = candidate
+        if len(text.strip()) >= MIN_PDF_TEXT_LENGTH:
+            break
+
+    if text is None:
+        raise error
     return text
 
 # Function to extract text from DOCX files
@@ -37,42 +155,154 @@ def extract_text_from_docx(file):
     doc = Document(file)
     return '\n'.join([para.text for para in doc.paragraphs])
 
-# Load the English NLP model from spaCy
-nlp = spacy.load('en_core_web_sm')
+# Trained components of en_core_web_sm, none of which are needed for extraction
+_MODEL_COMPONENTS = ['tok2vec', 'tagger', 'parser', 'senter', 'attribute_ruler', 'lemmatizer', 'ner']
 
-# Function to extract skills, education, and experience from a resume text
-def extract_resume_info(resume_text):
+# Function to load the English NLP model from spaCy
+@lru_cache(maxsize=None)
+def get_nlp():
     """
-    Extracts skills, education, and total experience from resume text.
+    Loads the English NLP model from spaCy on first use and reuses it afterwards.
+
+    Skills are found on the token text alone, so only the tokenizer is loaded and
+    the weights of the trained components are never deserialized.
+
+    Returns:
+        spacy.language.Language: The shared spaCy pipeline.
+    """
+    return spacy.load('en_core_web_sm', exclude=_MODEL_COMPONENTS)
+
+# Path to the skills taxonomy, one skill per line
+SKILLS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'skills.txt')
+
+# Function to load the skills taxonomy
+def _load_skills(path):
+    """
+    Loads the skills taxonomy from a text file.
 
     Args:
-        resume_text (str): The text of the resume.
+        path (str): The path to the file, with one skill per line.
 
     Returns:
-        dict: A dictionary containing:
-            - 'skills': List of unique skills extracted from the resume.
-            - 'education': List of educational qualifications found in the resume.
-            - 'total_experience': Total years of experience calculated from the resume.
+        list: The skills, in file order.
+    """
+    with open(path, encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip()]
+
+SKILLS = _load_skills(SKILLS_PATH)
+
+# Skills whose names are also everyday English words ("the rest", "a spark", "unity"),
+# which only count as skills when written with their exact capitalization
+CASE_SENSITIVE_SKILLS = frozenset({
+    'Airflow', 'Angular', 'Bash', 'Bootstrap', 'Dart', 'Elixir', 'Flask', 'Flutter',
+    'Hibernate', 'Oracle', 'React', 'REST', 'Ruby', 'Rust', 'SAP', 'Selenium',
+    'Snowflake', 'Spark', 'Tableau', 'Unity',
+})
+
+# Function to build the skill matchers
+@lru_cache(maxsize=None)
+def _get_skill_matchers():
+    """
+    Builds the phrase matchers for the skills taxonomy on first use.
+
+    Skills are matched case-insensitively, except for `CASE_SENSITIVE_SKILLS`, which
+    are matched on their exact spelling. Each skill is its own match key so that
+    matches map back to the skill's canonical name.
+
+    Returns:
+        tuple: The shared case-insensitive and case-sensitive `PhraseMatcher`.
+    """
+    nlp = get_nlp()
+    lower_matcher = PhraseMatcher(nlp.vocab, attr='LOWER')
+    orth_matcher = PhraseMatcher(nlp.vocab, attr='ORTH')
+    for skill, pattern in zip(SKILLS, nlp.tokenizer.pipe(SKILLS)):
+        matcher = orth_matcher if skill in CASE_SENSITIVE_SKILLS else lower_matcher
+        matcher.add(skill, [pattern])
+    return lower_matcher, orth_matcher
+
+# Position of each skill in the taxonomy, used as its vector index
+SKILL_INDEX = {skill: i for i, skill in enumerate(SKILLS)}
+
+# Function to map skill names to their taxonomy indices
+def _skill_ids(skills):
     """
-    # Process the resume text with spaCy
-    doc = nlp(resume_text)
+    Maps skill names to their indices in the taxonomy, skipping unknown skills.
 
-    # Extract skills (assuming skills are nouns or proper nouns)
-    skills = set()
-    for token in doc:
-        # Add nouns and proper nouns to the skills set
-        if token.pos_ in ['NOUN', 'PROPN'] and len(token.text) > 1:  # Ignore single character tokens
-            skills.add(token.text)
+    Args:
+        skills (iterable): Canonical skill names.
+
+    Returns:
+        list: The index of each known skill in `SKILLS`.
+    """
+    return [SKILL_INDEX[skill] for skill in skills if skill in SKILL_INDEX]
+
+# Function to find the skills mentioned in a text
+def _extract_skills(doc):
+    """
+    Finds the skills from the taxonomy mentioned in a processed text.
+
+    Where matches overlap, only the longest is kept, so "React Native" is not also
+    counted as "React".
 
-    # Extract education qualifications
-    education_keywords = {'Bachelor', 'Master', 'PhD', 'Associate', 'Degree', 'Certification'}
-    education = set()
-    for token in doc:
-        if token.text in education_keywords:
-            education.add(token.text)
+    Args:
+        doc (spacy.tokens.Doc): The text processed by spaCy.
+
+    Returns:
+        set: The canonical names of the skills found.
+    """
+    spans = [span for matcher in _get_skill_matchers() for span in matcher(doc, as_spans=True)]
+    return {span.label_ for span in filter_spans(spans)}
+
+# Bit assigned to each educational qualification, so that sets of qualifications
+# can be compared with a single bitwise AND
+EDU_BITS = {'Bachelor': 1, 'Master': 2, 'PhD': 4, 'Associate': 8, 'Degree': 16, 'Certification': 32}
+_EDU_BITS_LOWER = {edu.lower(): bit for edu, bit in EDU_BITS.items()}
+_EDU_NAMES_LOWER = {edu.lower(): edu for edu in EDU_BITS}
+
+# Function to encode educational qualifications as a bitmask
+def _education_mask(education):
+    """
+    Encodes educational qualifications as a bitmask of `EDU_BITS`.
+
+    Args:
+        education (iterable): Qualification names, in any letter case. Names that do not
+            lower-case to a known qualification (e.g. Unicode case-fold variants matched
+            by the case-insensitive `_EDU_RE`, such as 'Aſsociate') are ignored.
+
+    Returns:
+        int: The bitwise OR of the bits of the qualifications.
+    """
+    return reduce(or_, (_EDU_BITS_LOWER.get(edu.lower(), 0) for edu in education), 0)
+
+# Number of resumes tokenized per spaCy batch
+BATCH_SIZE = 32
+
+# Maximum number of parsed resumes kept in memory, keyed by a hash of their text
+RESUME_CACHE_SIZE = 256
+_resume_cache = OrderedDict()
+_resume_cache_lock = threading.Lock()
+
+# Function to extract skills, education, and experience from a parsed resume
+def _resume_info_from_doc(doc, resume_text):
+    """
+    Extracts skills, education, and total experience from a processed resume.
+
+    Args:
+        doc (spacy.tokens.Doc): The resume text processed by spaCy.
+        resume_text (str): The raw text of the resume.
+
+    Returns:
+        dict: See `extract_resume_info`.
+    """
+    # Extract the skills from the taxonomy mentioned in the resume
+    skills = _extract_skills(doc)
+
+    # Extract education qualifications, matched the same way as in job descriptions
+    education = {_EDU_NAMES_LOWER[edu.lower()] for edu in _EDU_RE.findall(resume_text)
+                 if edu.lower() in _EDU_NAMES_LOWER}
 
     # Extract experience using regex
-    experience = re.findall(r'(\d+)\s+(years?|months?)\s+(of|in)?\s*([A-Za-z\s]+)', resume_text)
+    experience = _EXPERIENCE_RE.findall(resume_text)
     experience_years = sum(int(exp[0]) for exp in experience if 'year' in exp[1].lower())
     experience_months = sum(int(exp[0]) for exp in experience if 'month' in exp[1].lower())
     total_experience = experience_years + experience_months / 12  # Convert months to years
@@ -80,68 +310,260 @@ def extract_resume_info(resume_text):
     return {
         'skills': list(skills),  # Unique skills
         'education': list(education),
+        'education_mask': _education_mask(education),
         'total_experience': total_experience
     }
 
+# Function to compute the cache key of a resume text
+def _text_digest(text):
+    """
+    Computes a content hash of a text, used as its parse cache key.
+
+    Args:
+        text (str): The text to hash.
+
+    Returns:
+        str: The hexadecimal BLAKE2b digest of the UTF-8 encoded text.
+    """
+    return hashlib.blake2b(text.encode('utf-8')).hexdigest()
+
+# Function to copy a cached resume info dictionary
+def _copy_resume_info(resume_info):
+    """
+    Copies a resume info dictionary so callers cannot mutate the cached entry.
+
+    Args:
+        resume_info (dict): A dictionary returned by `_resume_info_from_doc`.
+
+    Returns:
+        dict: A copy of the dictionary with its own skills and education lists.
+    """
+    return {
+        **resume_info,
+        'skills': list(resume_info['skills']),
+        'education': list(resume_info['education'])
+    }
+
+# Function to extract skills, education, and experience from several resume texts
+def extract_resume_info_batch(resume_texts, batch_size=BATCH_SIZE, n_process=1):
+    """
+    Extracts skills, education, and total experience from several resume texts.
+
+    The texts are streamed through `nlp.pipe`, which tokenizes them in
+    batches instead of one `nlp()` call per resume. Results are cached by a hash of
+    the resume text, so re-uploading an unchanged resume skips spaCy entirely.
+
+    Args:
+        resume_texts (list): List of resume texts.
+        batch_size (int): Number of texts processed per spaCy batch.
+        n_process (int): Number of worker processes. Only the tokenizer runs, so
+            sending the parsed documents back from workers costs more than it saves.
+
+    Returns:
+        list: One dictionary per resume, in input order (see `extract_resume_info`).
+    """
+    keys = [_text_digest(text) for text in resume_texts]
+
+    # Look up previously parsed resumes
+    parsed = {}
+    with _resume_cache_lock:
+        for key in keys:
+            if key in _resume_cache:
+                _resume_cache.move_to_end(key)
+                parsed[key] = _resume_cache[key]
+
+    # Parse the remaining resumes, each distinct text only once
+    pending = {key: text for key, text in zip(keys, resume_texts) if key not in parsed}
+    if pending:
+        texts = list(pending.values())
+        docs = get_nlp().pipe(texts, batch_size=batch_size, n_process=n_process)
+        for key, doc, text in zip(pending, docs, texts):
+            parsed[key] = _resume_info_from_doc(doc, text)
+
+        with _resume_cache_lock:
+            for key in pending:
+                _resume_cache[key] = parsed[key]
+            while len(_resume_cache) > RESUME_CACHE_SIZE:
+                _resume_cache.popitem(last=False)
+
+    return [_copy_resume_info(parsed[key]) for key in keys]
+
+# Function to extract skills, education, and experience from a resume text
+def extract_resume_info(resume_text):
+    """
+    Extracts skills, education, and total experience from resume text.
+
+    Args:
+        resume_text (str): The text of the resume.
+
+    Returns:
+        dict: A dictionary containing:
+            - 'skills': List of unique skills from the taxonomy found in the resume.
+            - 'education': List of educational qualifications found in the resume.
+            - 'education_mask': The qualifications found, as a bitmask of `EDU_BITS`.
+            - 'total_experience': Total years of experience calculated from the resume.
+    """
+    return extract_resume_info_batch([resume_text])[0]
+
+# Parsed job descriptions, stored as parallel arrays (one entry per job)
+@dataclass
+class JobCorpus:
+    """
+    A set of parsed job descriptions in struct-of-arrays layout.
+
+    The required skills form a sparse job x skill matrix in CSR form: the skills of
+    job `i` are the `SKILLS` indices `skill_indices[skill_indptr[i]:skill_indptr[i + 1]]`.
+
+    Attributes:
+        titles (list): The title of each job.
+        descriptions (list): The description of each job.
+        skill_indptr (numpy.ndarray): CSR row offsets into `skill_indices`, of length `len(titles) + 1`.
+        skill_indices (numpy.ndarray): The sorted, unique taxonomy indices of each job's required
+            skills, stored as `numpy.intp` so that NumPy can index with them without a cast.
+        experience_required (numpy.ndarray): The total experience required for each job.
+        education_masks (numpy.ndarray): The educational qualifications mentioned by each
+            job, as bitmasks of `EDU_BITS`.
+    """
+    titles: list
+    descriptions: list
+    skill_indptr: np.ndarray
+    skill_indices: np.ndarray
+    experience_required: np.ndarray
+    education_masks: np.ndarray
+
+    def __len__(self):
+        return len(self.titles)
+
+    def requirements(self, index):
+        """
+        Returns the skills required by a job.
+
+        Args:
+            index (int): The position of the job in the corpus.
+
+        Returns:
+            list: The canonical names of the skills required by the job.
+        """
+        start, stop = self.skill_indptr[index], self.skill_indptr[index + 1]
+        return [SKILLS[i] for i in self.skill_indices[start:stop]]
+
+# Function to load the job descriptions contained in a text
+def _load_job_descriptions(text, extension=None):
+    """
+    Loads the job descriptions contained in a plain text or JSON input.
+
+    JSON inputs hold one job object (with 'title' and 'description' keys) or a list
+    of them; any other input is a single description.
+
+    Args:
+        text (str): The content of the input.
+        extension (str, optional): The file extension of the input (e.g. '.json').
+            When omitted, inputs starting with '{' or '[' are tried as JSON.
+
+    Returns:
+        list: One dictionary per job description.
+    """
+    if extension is None:
+        is_json = text.lstrip()[:1] in ('{', '[')
+    else:
+        is_json = extension.lower() == '.json'
+
+    if is_json:
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError:
+            data = None
+        if isinstance(data, dict):
+            return [data]
+        if isinstance(data, list) and all(isinstance(job_desc, dict) for job_desc in data):
+            return data
+    return [{'description': text}]
+
 # Function to parse job descriptions from provided text
 def parse_job_descriptions(job_desc_texts):
     """
     Parses job descriptions from a list of text inputs.
 
     Args:
-        job_desc_texts (list): List of job description texts (can be JSON strings).
+        job_desc_texts (list): List of job description texts (can be JSON strings), or of
+            `(text, extension)` tuples when the file extension of each input is known.
 
     Returns:
-        list: A list of dictionaries containing parsed job descriptions, requirements,
-              experience required, education required, and job titles.
+        JobCorpus: The parsed job descriptions, requirements (the skills from the
+                   taxonomy mentioned in each description), total experience required,
+                   education required, and job titles.
     """
-    job_descriptions = []
-    for text in job_desc_texts:
-        # Load job description from JSON if applicable
-        job_desc = json.loads(text) if text.endswith('.json') else {'description': text}
-        job_title = job_desc.get('title', 'N/A')
-        job_descriptions.append({
-            'description': job_desc.get('description', ''),
-            'requirements': re.findall(r'\b\w+\b', job_desc.get('description', '')),
-            'experience_required': re.findall(r'(\d+)\s+(years?|months?)', job_desc.get('description', '')),
-            'education_required': re.findall(r'\b(Bachelor|Master|PhD|Associate|Degree|Certification)\b',
-                                             job_desc.get('description', re.I)),
-            'job_title': job_title
-        })
-    return job_descriptions
+    nlp = get_nlp()
+    titles, descriptions, job_skill_ids, experience_required, education_masks = [], [], [], [], []
+    for job_desc_text in job_desc_texts:
+        # Load job descriptions from JSON if applicable
+        text, extension = job_desc_text if isinstance(job_desc_text, tuple) else (job_desc_text, None)
+        for job_desc in _load_job_descriptions(text, extension):
+            # JSON inputs may hold any value here; only strings are descriptions
+            description = job_desc.get('description')
+            if not isinstance(description, str):
+                description = ''
+            titles.append(job_desc.get('title', 'N/A'))
+            descriptions.append(description)
+            job_skill_ids.append(sorted(_skill_ids(_extract_skills(nlp.make_doc(description)))))
+            experience_required.append(sum(int(exp[0]) for exp in _EXP_SHORT_RE.findall(description)
+                                           if len(exp[0]) <= MAX_EXPERIENCE_DIGITS))
+            education_masks.append(_education_mask(_EDU_RE.findall(description)))
+
+    skill_indptr = np.zeros(len(titles) + 1, dtype=np.int64)
+    np.cumsum([len(ids) for ids in job_skill_ids], out=skill_indptr[1:])
+    skill_indices = np.fromiter(chain.from_iterable(job_skill_ids), dtype=np.intp, count=skill_indptr[-1])
+
+    return JobCorpus(
+        titles=titles,
+        descriptions=descriptions,
+        skill_indptr=skill_indptr,
+        skill_indices=skill_indices,
+        experience_required=np.array(experience_required, dtype=np.int64),
+        education_masks=np.array(education_masks, dtype=np.uint8)
+    )
 
 # Function to match a resume with job descriptions
-def match_resume_with_jobs(resume_info, job_descriptions):
+def match_resume_with_jobs(resume_info, job_corpus):
     """
-    Matches a resume's extracted information with a list of job descriptions.
+    Matches a resume's extracted information with a corpus of job descriptions.
 
     Args:
-        resume_info (dict): A dictionary containing skills, education, and total experience from the resume.
-        job_descriptions (list): A list of dictionaries representing job descriptions.
+        resume_info (dict): A dictionary containing skills, education (and its mask), and total experience
+            from the resume, as returned by `extract_resume_info`.
+        job_corpus (JobCorpus): The parsed job descriptions.
 
     Returns:
         list: A list of dictionaries containing match results for each job, including:
-            - 'job_title - 'job_title': The title of the job.
+            - 'job_title': The title of the job.
             - 'job_description': The description of the job.
             - 'skills_match_percentage': The percentage of skills matched between the resume and job requirements.
             - 'experience_match': A boolean indicating if the resume meets the experience requirements.
             - 'education_match': A boolean indicating if the resume meets the education requirements.
             - 'total_experience_required': The total experience required for the job.
     """
-    results = []
-    for job in job_descriptions:
-        job_skills = job['requirements']
-        skills_match = len(set(resume_info['skills']).intersection(set(job_skills)))
-        total_skills = len(job_skills)
-        match_percentage = (skills_match / total_skills) * 100 if total_skills > 0 else 0
+    # Count the matched skills of every job in one pass over the non-zero entries
+    n_jobs = len(job_corpus)
+    total_skills = np.diff(job_corpus.skill_indptr)
+    resume_skills = np.zeros(len(SKILLS), dtype=bool)
+    resume_skills[_skill_ids(resume_info['skills'])] = True
+    rows = np.repeat(np.arange(n_jobs), total_skills)
+    skills_match = np.bincount(rows, weights=resume_skills[job_corpus.skill_indices], minlength=n_jobs)
+    match_percentages = np.divide(skills_match * 100, total_skills, out=np.zeros(n_jobs), where=total_skills > 0)
 
-        experience_required = sum(int(exp[0]) for exp in job['experience_required']) if job['experience_required'] else 0
-        experience_match = resume_info['total_experience'] >= experience_required
-        education_match = any(edu in resume_info['education'] for edu in job['education_required'])
+    # Compare the resume's experience against every job at once
+    experience_matches = np.greater_equal(resume_info['total_experience'], job_corpus.experience_required)
 
+    # A job's education is matched when the resume has any of the qualifications it mentions
+    education_matches = (job_corpus.education_masks & resume_info['education_mask']).astype(bool)
+
+    results = []
+    for title, description, match_percentage, experience_match, education_match, experience_required in zip(
+            job_corpus.titles, job_corpus.descriptions, match_percentages.tolist(), experience_matches.tolist(),
+            education_matches.tolist(), job_corpus.experience_required.tolist()):
         results.append({
-            'job_title': job['job_title'],
-            'job_description': job['description'],
+            'job_title': title,
+            'job_description': description,
             'skills_match_percentage': match_percentage,
             'experience_match': experience_match,
             'education_match': education_match,